@@ -11,7 +11,7 @@ class BitBucketCertTool(Tool):
             on_build="""
 apt-get update > /dev/null
 apt-get install -y git curl > /dev/null
-pip install requests > /dev/null
+pip install requests orjson > /dev/null
 pip install kubiya-sdk > /dev/null
             """,
             content=content,